@@ -16,6 +16,7 @@ except Exception:  # pragma: no cover
 class Settings:
     ga_id: str = os.getenv("GA_ID", "")
     cache_ttl_seconds: int = int(os.getenv("SEARCH_CACHE_TTL", "1800") or "1800")
+    cache_max_entries: int = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "512") or "512")
     debug: bool = os.getenv("FLASK_DEBUG", "true").lower() in {"1", "true", "yes"}
 
 
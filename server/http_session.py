@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def _build_session() -> requests.Session:
+    sess = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=1)
+    sess.mount("https://", adapter)
+    sess.mount("http://", adapter)
+    return sess
+
+
+# 외부 API 공용 세션(keep-alive + 커넥션 풀로 호스트당 TLS 핸드셰이크 재사용)
+session = _build_session()
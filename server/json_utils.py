@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+try:  # optional: orjson 설치 시 C 구현으로 직렬화
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - 선택 의존성
+    orjson = None  # type: ignore[assignment]
+
+
+HAS_ORJSON = orjson is not None
+
+
+def loads(data: str | bytes) -> Any:
+    """바이트/문자열 JSON 파싱(orjson 우선, 없으면 표준 json)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """orjson 기반 Flask JSON provider.
+
+    기본 provider와 출력 규칙(키 정렬, 디버그 시 들여쓰기, datetime 등 기본 변환)을 맞추고,
+    indent 이외의 json.dumps 인자가 넘어오면 기본 구현으로 위임한다.
+    """
+
+    def _options(self, indent: bool = False) -> int:
+        opts = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            opts |= orjson.OPT_SORT_KEYS
+        if indent:
+            opts |= orjson.OPT_INDENT_2
+        return opts
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(
+            obj,
+            default=self.default,
+            option=self._options(indent=indent) | orjson.OPT_APPEND_NEWLINE,
+        )
+        return self._app.response_class(body, mimetype=self.mimetype)
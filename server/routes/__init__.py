@@ -0,0 +1,2 @@
+# Makes routes a package
+
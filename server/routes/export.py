@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import csv
+import io
+from datetime import datetime
+from typing import Any, Dict, Iterator, List
+from urllib.parse import quote
+
+from flask import Blueprint, Response, request
+
+from server.routes.reviews import parse_reviews_query
+from server.services.reviews_service import build_reviews_payload
+
+
+export_bp = Blueprint("export", __name__)
+
+
+def _iter_csv(rows: List[Dict[str, Any]], columns: List[str]) -> Iterator[str]:
+    """CSV를 행 단위로 스트리밍(엑셀 호환을 위해 BOM 1회 선행)."""
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=columns, extrasaction="ignore", lineterminator="\n")
+    writer.writeheader()
+    yield "\ufeff" + buf.getvalue()
+    for row in rows:
+        buf.seek(0)
+        buf.truncate()
+        writer.writerow(row)
+        yield buf.getvalue()
+
+
+@export_bp.get("/api/export/csv")
+def export_csv() -> Response:
+    query = parse_reviews_query(request.args)
+    if not query.app_id:
+        return Response("Missing appId", status=400)
+
+    try:
+        payload = build_reviews_payload(
+            app_id=query.app_id,
+            count=query.count,
+            days=query.days,
+            from_date=query.from_date,
+            rating_exact=query.rating_exact,
+            rating_max=query.rating_max,
+        )
+        # Preserve column order
+        columns = [
+            "출처",
+            "서비스명",
+            "날짜",
+            "닉네임",
+            "내용",
+            "심각도 점수",
+            "순위",
+            "백분위",
+            "평점",
+            "좋아요",
+        ]
+
+        today_str = datetime.now().strftime("%Y%m%d")
+        filename_utf8 = f"{payload['meta']['service_name']}_리뷰_{today_str}.csv"
+        filename_quoted = quote(filename_utf8)
+        headers = {
+            # ASCII fallback + RFC5987 filename*
+            "Content-Disposition": f"attachment; filename=export.csv; filename*=UTF-8''{filename_quoted}",
+            "Content-Type": "text/csv; charset=utf-8",
+        }
+        return Response(_iter_csv(payload["rows"], columns), headers=headers)
+    except Exception as exc:  # noqa: BLE001
+        return Response(str(exc), status=500)
+
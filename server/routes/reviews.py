@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Optional
+
+from flask import Blueprint, jsonify, request
+from werkzeug.datastructures import MultiDict
+
+from server.services.reviews_service import build_reviews_payload, build_reviews_multi_payload
+
+
+reviews_bp = Blueprint("reviews", __name__)
+
+# 기간 상한(약 10년). 너무 큰 days는 임계 날짜 계산에서 OverflowError를 낸다
+_MAX_DAYS = 3650
+
+
+def _parse_int(val: Any, default: int, min_v: int | None = None, max_v: int | None = None) -> int:
+    try:
+        num = int(val)
+    except Exception:
+        return default
+    if min_v is not None and num < min_v:
+        num = min_v
+    if max_v is not None and num > max_v:
+        num = max_v
+    return num
+
+
+def _parse_optional_int(val: Any) -> Optional[int]:
+    if val is None:
+        return None
+    try:
+        return int(val)
+    except Exception:
+        return None
+
+
+@dataclass(frozen=True)
+class ReviewQuery:
+    app_id: str
+    count: int
+    days: int
+    from_date: Optional[date]
+    rating_exact: Optional[int]
+    rating_max: Optional[int]
+
+
+def parse_reviews_query(args: MultiDict) -> ReviewQuery:
+    """/api/reviews, /api/export/csv 공통 쿼리 파싱(잘못된 정수는 기본값/None 처리)."""
+    # 기간: days(정수, 0이면 전체) 또는 fromDate(YYYYMMDD)
+    from_date: Optional[date] = None
+    from_date_str = args.get("fromDate")
+    if from_date_str:
+        try:
+            from_date = datetime.strptime(from_date_str, "%Y%m%d").date()
+        except ValueError:
+            from_date = None
+
+    # 수집 상한: 과도한 count는 Google Play 페이지 호출을 폭증시키므로 1~1000으로 제한
+    count = max(1, min(args.get("count", default=250, type=int), 1000))
+    # days는 0(전체 기간)~_MAX_DAYS
+    days = max(0, min(args.get("days", default=365, type=int), _MAX_DAYS))
+
+    return ReviewQuery(
+        app_id=args.get("appId", "").strip(),
+        count=count,
+        days=days,
+        from_date=from_date,
+        # 평점: ratingExact 또는 ratingMax
+        rating_exact=args.get("ratingExact", type=int),
+        rating_max=args.get("ratingMax", type=int),
+    )
+
+
+@reviews_bp.get("/api/reviews")
+def fetch_reviews() -> Any:
+    query = parse_reviews_query(request.args)
+    if not query.app_id:
+        return jsonify({"error": "Missing appId"}), 400
+
+    try:
+        payload = build_reviews_payload(
+            app_id=query.app_id,
+            count=query.count,
+            days=query.days,
+            from_date=query.from_date,
+            rating_exact=query.rating_exact,
+            rating_max=query.rating_max,
+        )
+        return jsonify(payload)
+    except Exception as exc:  # noqa: BLE001
+        return jsonify({"error": str(exc)}), 500
+
+
+@reviews_bp.post("/api/reviews/multi")
+def fetch_reviews_multi() -> Any:
+    try:
+        data = request.get_json(force=True) or {}
+        selected_apps = data.get("selectedApps", [])
+        if not isinstance(selected_apps, list) or not selected_apps:
+            return jsonify({"error": "선택된 앱이 없습니다."}), 400
+        if len(selected_apps) > 10:
+            return jsonify({"error": "최대 10개의 앱만 선택할 수 있습니다."}), 400
+
+        count_per_app = _parse_int(data.get("countPerApp", 250), 250, 1, 1000)
+        days = _parse_int(data.get("days", 365), 365, 1, _MAX_DAYS)
+        from_date_str = data.get("fromDate")
+        from_date = None
+        if isinstance(from_date_str, str) and len(from_date_str) == 8:
+            try:
+                from_date = datetime.strptime(from_date_str, "%Y%m%d").date()
+            except ValueError:
+                from_date = None
+
+        payload = build_reviews_multi_payload(
+            selected_apps=selected_apps,
+            count_per_app=count_per_app,
+            days=days,
+            from_date=from_date,
+            rating_exact=_parse_optional_int(data.get("ratingExact")),
+            rating_max=_parse_optional_int(data.get("ratingMax")),
+        )
+        return jsonify(payload)
+    except Exception as exc:  # noqa: BLE001
+        return jsonify({"error": str(exc)}), 500
+
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List
+
+from flask import Blueprint, jsonify, request
+
+from server.cache import TTLCache
+from server.config import settings
+from server.http_session import session
+from server.json_utils import loads as json_loads
+
+
+search_bp = Blueprint("search", __name__)
+
+# 스토어 URL에서 App ID 추출용 패턴
+_APPSTORE_ID_RE = re.compile(r"/id(\d+)")
+_PLAY_ID_RE = re.compile(r"[?&]id=([a-zA-Z0-9_.]+)")
+
+# 검색 응답 캐시(TTL + 크기 상한 LRU)
+_search_cache = TTLCache(maxsize=settings.cache_max_entries, ttl=settings.cache_ttl_seconds)
+# 앱 단건 메타 캐시((os, app_id) 키, 사용자 간 공유)
+_app_meta_cache = TTLCache(maxsize=1024, ttl=settings.cache_ttl_seconds)
+
+
+def _parse_app_url(q: str) -> tuple[str | None, str | None]:
+    lower = q.lower()
+    # App Store URL 예: https://apps.apple.com/kr/app/토스/id839333328
+    if "apps.apple.com" in lower:
+        m = _APPSTORE_ID_RE.search(lower)
+        if m:
+            return "ios", m.group(1)
+    # Google Play URL 예: https://play.google.com/store/apps/details?id=com.kakao.talk
+    if "play.google.com" in lower:
+        m = _PLAY_ID_RE.search(q)
+        if m:
+            return "android", m.group(1)
+    return None, None
+
+
+def _lookup_app_meta(os_name: str, app_id: str) -> Dict[str, Any]:
+    """단일 앱 메타 조회(os, app_id 단위 TTL 캐시). 조회 실패 시 ID만 채워 반환."""
+    cache_key = (os_name, app_id)
+    cached = _app_meta_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        if os_name == "ios":
+            resp = session.get(
+                "https://itunes.apple.com/lookup",
+                params={"id": app_id, "country": "KR"},
+                timeout=15,
+            )
+            resp.raise_for_status()
+            data = json_loads(resp.content)
+            r = (data.get("results") or [{}])[0]
+            meta = {
+                "appId": str(r.get("trackId") or app_id),
+                "title": r.get("trackName") or "",
+                "developer": r.get("sellerName") or r.get("artistName") or "",
+                "score": r.get("averageUserRating"),
+                "icon": r.get("artworkUrl100") or r.get("artworkUrl60") or "",
+                "os": "ios",
+            }
+        else:  # android
+            from google_play_scraper import app as gp_app
+
+            app_meta = gp_app(app_id, lang="ko", country="kr")
+            meta = {
+                "appId": app_id,
+                "title": app_meta.get("title"),
+                "developer": app_meta.get("developer"),
+                "score": app_meta.get("score"),
+                "icon": app_meta.get("icon"),
+                "os": "android",
+            }
+    except Exception:
+        # 메타 조회 실패 시 ID만 반환(실패 결과는 캐시하지 않음)
+        return {
+            "appId": str(app_id),
+            "title": "",
+            "developer": "",
+            "score": None,
+            "icon": "",
+            "os": "ios" if os_name == "ios" else "android",
+        }
+
+    _app_meta_cache.set(cache_key, meta)
+    return meta
+
+
+@search_bp.get("/api/search")
+def search_apps() -> Any:
+    query = request.args.get("q", "").strip()
+    os_name = request.args.get("os", "android").strip().lower()
+    if not query:
+        return jsonify({"items": []})
+
+    try:
+        parsed_os, parsed_id = _parse_app_url(query)
+
+        # 길이 제한: 일반 검색어만 제한. URL이나 명시적 ID는 허용
+        if parsed_id is None and len(query) > 100:
+            return jsonify({"error": "검색어가 너무 깁니다."}), 400
+
+        # 캐시 키
+        cache_key = f"{os_name}__{query}"
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            return jsonify({"items": cached})
+
+        items: List[Dict[str, Any]] = []
+
+        # URL에서 직접 추출된 경우: 단건 조회로 메타 구성
+        if parsed_id:
+            items.append(_lookup_app_meta(parsed_os or os_name, parsed_id))
+        else:
+            # 일반 검색 흐름
+            if os_name == "ios":
+                # iTunes Search API (limited fields)
+                resp = session.get(
+                    "https://itunes.apple.com/search",
+                    params={
+                        "term": query,
+                        "country": "KR",
+                        "entity": "software",
+                        "limit": 20,
+                    },
+                    timeout=15,
+                )
+                resp.raise_for_status()
+                data = json_loads(resp.content)
+                items = [
+                    {
+                        "appId": str(r.get("trackId")),
+                        "title": r.get("trackName"),
+                        "developer": r.get("sellerName") or r.get("artistName"),
+                        "score": r.get("averageUserRating"),
+                        "icon": r.get("artworkUrl100") or r.get("artworkUrl60"),
+                        "os": "ios",
+                    }
+                    for r in data.get("results", [])
+                ]
+            else:
+                from google_play_scraper import search as gp_search
+
+                results = gp_search(
+                    query,
+                    lang="ko",
+                    country="kr",
+                    n_hits=20,
+                )
+                items = [
+                    {
+                        "appId": r.get("appId"),
+                        "title": r.get("title"),
+                        "developer": r.get("developer"),
+                        "score": r.get("score"),
+                        "icon": r.get("icon"),
+                        "os": "android",
+                    }
+                    for r in results
+                ]
+
+        # 캐시에 적재
+        _search_cache.set(cache_key, items)
+        return jsonify({"items": items})
+    except Exception as exc:  # noqa: BLE001
+        return jsonify({"error": str(exc)}), 500
+
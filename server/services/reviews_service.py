@@ -4,18 +4,29 @@ import math
 import re
 from datetime import datetime, timedelta, date
 import xml.etree.ElementTree as ET
-import requests
-from typing import Any, Dict, List, Optional, Set, Tuple
-import urllib.request
-import urllib.parse
-import json
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
-import pandas as pd
-from google_play_scraper import Sort, reviews, app as gp_app
+from server.cache import TTLCache
+from server.config import settings
+from server.http_session import session
+from server.json_utils import loads as json_loads
+
+try:  # optional: lxml 설치 시 C 파서로 스트리밍 파싱
+    from lxml import etree as LET  # type: ignore
+except Exception:  # pragma: no cover - 선택 의존성
+    LET = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:  # 무거운 의존성은 실제 사용 시점에 지연 import(서버리스 콜드스타트 단축)
+    import pandas as pd
+
+
+_KOREAN_RE = re.compile(r"[가-힣]")
 
 
 def count_korean_chars(text: str) -> int:
-    return len(re.findall(r"[가-힣]", text or ""))
+    return len(_KOREAN_RE.findall(text or ""))
 
 
 def count_meaningful_chars_all(text: str) -> int:
@@ -25,12 +36,110 @@ def count_meaningful_chars_all(text: str) -> int:
     return sum(1 for ch in text if ch.isalnum())
 
 
+def has_min_meaningful_chars(text: str, n: int) -> bool:
+    """영숫자(언어 무관)가 n자 이상인지 판정. n자에 도달하면 즉시 종료."""
+    if not text:
+        return n <= 0
+    c = 0
+    for ch in text:
+        if ch.isalnum():
+            c += 1
+            if c >= n:
+                return True
+    return c >= n
+
+
+# 평점(1~5)별 가중치. 인덱스 = 평점
+_RATING_WEIGHTS = (0.0, 1.0, 0.8, 0.5, 0.2, 0.1)
+
+
 def get_rating_weight(score: int) -> float:
-    return {1: 1.0, 2: 0.8, 3: 0.5, 4: 0.2, 5: 0.1}.get(score, 0.0)
+    return _RATING_WEIGHTS[score] if 1 <= score <= 5 else 0.0
+
+
+def _round2(x: float) -> float:
+    """소수 둘째 자리 반올림(0 이상 값 전용, 사사오입). pandas 경로는 np.floor로 같은 연산을 한다."""
+    return int(x * 100 + 0.5) / 100.0
 
 
 def calc_percentile_display(rank: int, total: int) -> float:
-    return round((total - rank + 1) / total * 100, 2) if total else 0.0
+    return _round2((total - rank + 1) / total * 100) if total else 0.0
+
+
+def _assign_priority_score(df: pd.DataFrame) -> None:
+    """평점/좋아요 열로 심각도 점수(weight * (1 + log2(1 + 좋아요)))를 열 단위로 계산."""
+    import numpy as np
+
+    weights = np.asarray(_RATING_WEIGHTS)[df["평점"].to_numpy(dtype=np.int64)]
+    thumbs = df["좋아요"].to_numpy(dtype=np.float64)
+    scores = weights * (1 + np.log2(1 + thumbs))
+    df["심각도 점수"] = np.floor(scores * 100 + 0.5) / 100.0  # _round2와 동일
+
+
+def _assign_rank_percentile(df: pd.DataFrame) -> None:
+    """정렬된 df에 심각도 점수 기준 dense 순위와 백분위를 열 단위로 부여."""
+    import numpy as np
+
+    # 점수 종류가 적으므로 np.unique 역인덱스로 dense 순위를 바로 구함(음수화로 내림차순)
+    _, inv = np.unique(-df["심각도 점수"].to_numpy(dtype=np.float64), return_inverse=True)
+    ranks = inv + 1
+    df["순위"] = ranks
+    total = len(df)
+    percentiles = (total - ranks + 1) / total * 100
+    df["백분위"] = np.floor(percentiles * 100 + 0.5) / 100.0  # _round2와 동일
+
+
+# _rank_rows가 계산해 채우는 열(날짜 문자열도 출력 행에 대해서만 날짜_dt에서 만든다)
+_RANKED_COLUMNS = ("심각도 점수", "순위", "백분위", "날짜")
+
+# 이 건수를 넘으면 pandas 열 연산으로 정렬/순위 계산(소규모는 순수 파이썬이 더 빠름)
+_PANDAS_MIN_ROWS = 5000
+
+
+def _rank_rows(rows: List[Dict[str, Any]], columns: List[str]) -> List[Dict[str, Any]]:
+    """심각도 점수 계산 → 점수 우선(동점 시 최신순) 정렬 → dense 순위/백분위 부여 후 columns 순서의 행 목록 반환."""
+    if len(rows) > _PANDAS_MIN_ROWS:
+        return _rank_rows_frame(rows, columns)
+
+    for r in rows:
+        r["심각도 점수"] = _round2(_RATING_WEIGHTS[r["평점"]] * (1 + math.log2(1 + r["좋아요"])))
+    # 안정 정렬이므로 점수/날짜가 모두 같으면 기존 순서 유지
+    rows.sort(key=lambda r: (r["심각도 점수"], r["날짜_dt"]), reverse=True)
+
+    total = len(rows)
+    ranked: List[Dict[str, Any]] = []
+    rank = 0
+    prev_score = None
+    for r in rows:
+        if r["심각도 점수"] != prev_score:
+            rank += 1
+            prev_score = r["심각도 점수"]
+        r["순위"] = rank
+        r["백분위"] = calc_percentile_display(rank, total)
+        r["날짜"] = r["날짜_dt"].isoformat()[:10]
+        ranked.append({c: r[c] for c in columns})
+    return ranked
+
+
+def _rank_rows_frame(rows: List[Dict[str, Any]], columns: List[str]) -> List[Dict[str, Any]]:
+    import pandas as pd
+
+    # 행 dict 목록 대신 열 단위(dict of lists)로 구성해 행별 키 탐색/dtype 추론을 생략
+    fields = [c for c in columns if c not in _RANKED_COLUMNS]
+    fields += [c for c in ("평점", "좋아요", "날짜_dt") if c not in fields]
+    df = pd.DataFrame({c: [r[c] for r in rows] for c in fields})
+    _assign_priority_score(df)
+    df = df.sort_values(by=["심각도 점수", "날짜_dt"], ascending=[False, False]).reset_index(drop=True)
+    _assign_rank_percentile(df)
+    df["날짜"] = df["날짜_dt"].dt.strftime("%Y-%m-%d")
+    return df[columns].to_dict(orient="records")
+
+
+def _effective_rating_max(rating_exact: Optional[int], rating_max: Optional[int]) -> Optional[int]:
+    """평점 상한 필터 값(1~5로 보정). rating_exact가 있으면 상한은 적용하지 않으므로 None."""
+    if rating_exact is not None or rating_max is None:
+        return None
+    return max(1, min(5, rating_max))
 
 
 def compute_threshold_dt(days: int, from_date: Optional[date]) -> Optional[datetime]:
@@ -48,8 +157,11 @@ def fetch_reviews_iteratively(
     rating_exact: Optional[int],
     rating_max: Optional[int],
 ) -> List[Dict[str, Any]]:
+    from google_play_scraper import Sort, reviews
+
     all_reviews: List[Dict[str, Any]] = []
     seen_ids: Set[str] = set()
+    rating_cap = _effective_rating_max(rating_exact, rating_max)
     token: Optional[Tuple] = None
 
     # 안전 상한: 필터로 많이 탈락할 수 있어 넉넉히 가져옴
@@ -81,11 +193,11 @@ def fetch_reviews_iteratively(
             at: datetime = r.get("at")
 
             # 필터
-            if score not in [1, 2, 3, 4, 5]:
+            if not 1 <= score <= 5:
                 continue
             if rating_exact is not None and score != rating_exact:
                 continue
-            if rating_exact is None and rating_max is not None and score > max(1, min(5, rating_max)):
+            if rating_cap is not None and score > rating_cap:
                 continue
             if not isinstance(at, datetime):
                 continue
@@ -94,24 +206,23 @@ def fetch_reviews_iteratively(
                 token = None
                 break
             # iOS는 한국어 외 리뷰가 섞여 있어, 의미있는 문자(영숫자) 15자 기준으로 필터
-            if count_meaningful_chars_all(text) < 15:
+            if not has_min_meaningful_chars(text, 15):
                 continue
 
-            weight = get_rating_weight(score)
-            priority_score = round(weight * (1 + math.log2(1 + thumbs_up)), 2)
-
             all_reviews.append(
                 {
                     "출처": "Google Play",
                     "날짜_dt": at,
-                    "날짜": at.strftime("%Y-%m-%d"),
                     "닉네임": r.get("userName"),
                     "내용": text,
-                    "심각도 점수": priority_score,
                     "평점": score,
                     "좋아요": thumbs_up,
                 }
             )
+            if len(all_reviews) >= desired_count:
+                # 목표 수량 확보 시 남은 배치 항목은 파싱하지 않음
+                token = None
+                break
 
         if token is None or len(all_reviews) >= desired_count:
             break
@@ -119,6 +230,23 @@ def fetch_reviews_iteratively(
     return all_reviews
 
 
+# 앱 메타 캐시((app_id, lang, country) 키). 같은 앱을 반복 조회할 때 Google Play 왕복을 생략
+_app_info_cache = TTLCache(maxsize=256, ttl=settings.cache_ttl_seconds)
+
+
+def _get_app_info(app_id: str, lang: str = "ko", country: str = "kr") -> Dict[str, Any]:
+    cache_key = (app_id, lang, country)
+    cached = _app_info_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    from google_play_scraper import app as gp_app
+
+    app_info = gp_app(app_id, lang=lang, country=country)
+    _app_info_cache.set(cache_key, app_info)
+    return app_info
+
+
 def build_reviews_payload(
     app_id: str,
     count: int = 250,
@@ -127,7 +255,7 @@ def build_reviews_payload(
     rating_exact: Optional[int] = None,
     rating_max: Optional[int] = 3,
 ) -> Dict[str, Any]:
-    app_info = gp_app(app_id, lang="ko", country="kr")
+    app_info = _get_app_info(app_id)
     app_name: str = app_info.get("title", "").split("-")[0].strip()
 
     threshold_dt = compute_threshold_dt(days=days, from_date=from_date)
@@ -147,13 +275,7 @@ def build_reviews_payload(
     rows = raw_rows[:count]
 
     if rows:
-        df = pd.DataFrame(rows)
-        # 요청: 심각도 점수 우선 정렬(동점 시 최신 순)
-        df = df.sort_values(by=["심각도 점수", "날짜_dt"], ascending=[False, False]).reset_index(drop=True)
-        df["순위"] = df["심각도 점수"].rank(method="dense", ascending=False).astype(int)
-        total = len(df)
-        df["백분위"] = df["순위"].apply(lambda r: calc_percentile_display(int(r), total))
-        df = df[[
+        rows = _rank_rows(rows, [
             "출처",
             "서비스명",
             "날짜",
@@ -164,8 +286,7 @@ def build_reviews_payload(
             "백분위",
             "평점",
             "좋아요",
-        ]]
-        rows = df.to_dict(orient="records")
+        ])
 
     payload: Dict[str, Any] = {
         "meta": {
@@ -182,15 +303,206 @@ def build_reviews_payload(
     return payload
 
 
-def _safe_get(d: Dict[str, Any], path: List[str], default: Any = None) -> Any:
-    cur: Any = d
-    for k in path:
-        if not isinstance(cur, dict):
-            return default
-        cur = cur.get(k)
-        if cur is None:
-            return default
-    return cur
+def _parse_apple_dt(value: str) -> Optional[datetime]:
+    """Apple RSS의 ISO-8601 시각(예: 2024-05-01T12:34:56-07:00)을 로컬 naive datetime으로 변환.
+
+    Google Play 리뷰 시각과 기간 임계값(datetime.now 기준)이 모두 naive이므로 비교/정렬이 가능하도록 맞춘다.
+    """
+    if not value:
+        return None
+    if value.endswith("Z"):  # Python 3.10의 fromisoformat은 'Z'를 받지 않음
+        value = value[:-1] + "+00:00"
+    try:
+        at = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if at.tzinfo is not None:
+        at = at.astimezone().replace(tzinfo=None)
+    return at
+
+
+_APPLE_HEADERS = {"User-Agent": "Mozilla/5.0"}
+# 레거시 페이지 피드 동시 요청 수(앱별 수집도 병렬이므로 작게 유지)
+_IOS_PAGE_WORKERS = 4
+_ATOM_ENTRY_TAG = "{http://www.w3.org/2005/Atom}entry"
+_FEED_CHUNK_SIZE = 16 * 1024
+_XML_ERRORS: Tuple[type, ...] = (ET.ParseError,) + ((LET.XMLSyntaxError,) if LET is not None else ())
+
+
+# Apple 피드 응답 캐시(URL 키, 짧은 TTL). 실패 응답은 캐시하지 않음
+_feed_cache = TTLCache(maxsize=256, ttl=300)
+
+
+def _fetch_feed_page(url: str) -> Optional[bytes]:
+    cached = _feed_cache.get(url)
+    if cached is not None:
+        return cached
+    try:
+        resp = session.get(url, headers=_APPLE_HEADERS, timeout=15)
+        resp.raise_for_status()
+    except Exception:
+        return None
+    content = resp.content
+    _feed_cache.set(url, content)
+    return content
+
+
+def _stream_feed(url: str, timeout: float) -> Iterator[bytes]:
+    """피드 본문을 청크 단위로 받으면서 바로 넘긴다(다운로드와 파싱을 겹침).
+
+    소비 측이 중간에 close()하면 연결을 닫아 남은 본문은 받지 않는다.
+    끝까지 받은 본문만 캐시하며, 캐시 적중 시 저장된 바이트를 그대로 넘긴다.
+    """
+    cached = _feed_cache.get(url)
+    if cached is not None:
+        yield cached
+        return
+    try:
+        resp = session.get(url, headers=_APPLE_HEADERS, timeout=timeout, stream=True)
+    except Exception:
+        return
+    try:
+        resp.raise_for_status()
+        chunks: List[bytes] = []
+        for chunk in resp.iter_content(chunk_size=_FEED_CHUNK_SIZE):
+            chunks.append(chunk)
+            yield chunk
+        _feed_cache.set(url, b"".join(chunks))
+    except Exception:
+        return
+    finally:
+        resp.close()
+
+
+def _iter_feed_entries(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Apple RSS(Atom) entry 요소를 바이트 청크가 들어오는 대로 순서대로 파싱.
+
+    첫 entry는 앱 메타이므로 건너뛰며, 처리된 entry는 바로 비워 메모리를 회수한다.
+    파싱 오류가 나면 그 지점까지의 entry만 반환한다.
+    """
+    if LET is not None:
+        parser = LET.XMLPullParser(events=("end",), tag=_ATOM_ENTRY_TAG)
+    else:
+        parser = ET.XMLPullParser(events=("end",))
+    is_meta = True
+    try:
+        for _, elem in _pull_events(parser, chunks):
+            if elem.tag != _ATOM_ENTRY_TAG:
+                continue
+            if is_meta:
+                is_meta = False
+            else:
+                yield elem
+            elem.clear()
+    except _XML_ERRORS:
+        return
+
+
+def _pull_events(parser: Any, chunks: Iterable[bytes]) -> Iterator[Tuple[str, Any]]:
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
+def _entry_fields(entry: Any) -> Tuple[str, str, str, str, str]:
+    """entry 자식을 한 번만 순회해 (id, 본문, 작성자, 평점, 갱신시각) 텍스트를 추출.
+
+    content는 text/html 두 개가 오므로 첫 번째(text)만 사용한다.
+    """
+    fields: Dict[str, str] = {}
+    author = ""
+    for child in entry:
+        tag = child.tag
+        if not isinstance(tag, str):  # 주석/처리 지시문
+            continue
+        name = tag.rsplit("}", 1)[-1]
+        if name == "author":
+            for sub in child:
+                if isinstance(sub.tag, str) and sub.tag.rsplit("}", 1)[-1] == "name":
+                    author = sub.text or ""
+                    break
+        elif name not in fields:
+            fields[name] = child.text or ""
+    return (
+        fields.get("id", ""),
+        fields.get("content", ""),
+        author,
+        fields.get("rating") or "0",
+        fields.get("updated", ""),
+    )
+
+
+# JSON 피드의 중첩 키 조회. 경로가 거의 항상 존재하므로 단계별 검사 대신 예외로 처리
+def _get2(d: Any, k1: str, k2: str, default: Any = "") -> Any:
+    try:
+        return d[k1][k2]
+    except (KeyError, TypeError):
+        return default
+
+
+def _get3(d: Any, k1: str, k2: str, k3: str, default: Any = "") -> Any:
+    try:
+        return d[k1][k2][k3]
+    except (KeyError, TypeError):
+        return default
+
+
+@dataclass(frozen=True)
+class _ReviewFilters:
+    threshold_dt: Optional[datetime]
+    rating_exact: Optional[int]
+    rating_cap: Optional[int]  # _effective_rating_max로 보정된 상한
+
+
+# _build_ios_row 반환값: 기간 임계 이전 리뷰 도달(최신순이므로 이후는 볼 필요 없음)
+_STOP = object()
+
+
+def _build_ios_row(
+    rid: str,
+    text: str,
+    author: str,
+    rating_str: str,
+    updated_str: str,
+    filters: _ReviewFilters,
+    seen_ids: Set[str],
+) -> Any:
+    """iOS 피드 entry 하나를 필터링해 행 dict로 변환. 제외 대상이면 None, 기간 임계 도달 시 _STOP."""
+    if not rid or rid in seen_ids:
+        return None
+    seen_ids.add(rid)
+
+    try:
+        score = int(rating_str)
+    except Exception:
+        score = 0
+    at = _parse_apple_dt(updated_str)
+
+    # 필터 조건
+    if not 1 <= score <= 5:
+        return None
+    if filters.rating_exact is not None and score != filters.rating_exact:
+        return None
+    if filters.rating_cap is not None and score > filters.rating_cap:
+        return None
+    if not isinstance(at, datetime):
+        return None
+    if filters.threshold_dt is not None and at < filters.threshold_dt:
+        return _STOP
+    if not has_min_meaningful_chars(text, 10):
+        return None
+
+    return {
+        "OS": "iOS",
+        "출처": "iOS",
+        "날짜_dt": at,
+        "닉네임": author,
+        "내용": text,
+        "평점": score,
+        "좋아요": 0,
+    }
 
 
 def fetch_reviews_ios(
@@ -202,166 +514,75 @@ def fetch_reviews_ios(
 ) -> List[Dict[str, Any]]:
     """Apple RSS(XML) 직접 파싱.
     1) 권장 단일 엔드포인트: /rss/customerreviews/id=.../sortBy=mostRecent/xml (KR→US)
-    2) 보완: 필요시 page=.. JSON/RSS 루프 시도(레거시)
+    2) 보완: 필요시 page=.. RSS 루프 시도(레거시)
+    3) 최후: XML로 한 건도 얻지 못했을 때만 page=.. JSON 피드
     """
     collected: List[Dict[str, Any]] = []
     seen_ids: Set[str] = set()
+    filters = _ReviewFilters(
+        threshold_dt=threshold_dt,
+        rating_exact=rating_exact,
+        rating_cap=_effective_rating_max(rating_exact, rating_max),
+    )
     countries = ["kr", "us"]
     max_pages = 10
-    ns = {"atom": "http://www.w3.org/2005/Atom", "im": "http://itunes.apple.com/rss"}
 
     # 1) 단일 XML 피드 우선 시도 (페이지 매개변수 없이 최신순)
-    headers = {"User-Agent": "Mozilla/5.0"}
     for country in countries:
         url = f"https://itunes.apple.com/{country}/rss/customerreviews/id={app_id}/sortBy=mostRecent/xml"
+        # 기간 임계/목표 수량에 도달하면 스트림을 닫아 나머지 본문은 받지 않음
+        chunks = _stream_feed(url, timeout=10)
         try:
-            resp = requests.get(url, headers=headers, timeout=10)
-            resp.raise_for_status()
-            root = ET.fromstring(resp.content)
-        except Exception:
-            root = None
-
-        if root is not None:
-            entries = root.findall("atom:entry", ns)
-            if entries and len(entries) > 1:
-                for e in entries[1:]:
-                    review_id = e.findtext("atom:id", default="", namespaces=ns) or ""
-                    if not review_id or review_id in seen_ids:
-                        continue
-                    seen_ids.add(review_id)
-
-                    text = e.findtext("atom:content", default="", namespaces=ns) or ""
-                    author = e.findtext("atom:author/atom:name", default="", namespaces=ns) or ""
-                    rating_str = e.findtext("im:rating", default="0", namespaces=ns) or "0"
-                    try:
-                        score = int(rating_str)
-                    except Exception:
-                        score = 0
-                    updated_str = e.findtext("atom:updated", default="", namespaces=ns) or ""
-                    at: Optional[datetime] = None
-                    if updated_str:
-                        try:
-                            ts = updated_str.replace("Z", "+0000")
-                            at = datetime.strptime(ts, "%Y-%m-%dT%H:%M:%S%z")
-                        except Exception:
-                            try:
-                                at = datetime.fromisoformat(updated_str.replace("Z", "+00:00"))
-                            except Exception:
-                                at = None
-
-                    if score not in [1, 2, 3, 4, 5]:
-                        continue
-                    if rating_exact is not None and score != rating_exact:
-                        continue
-                    if rating_exact is None and rating_max is not None and score > max(1, min(5, rating_max)):
-                        continue
-                    if not isinstance(at, datetime):
-                        continue
-                    if threshold_dt is not None and at < threshold_dt:
-                        # 최신순이므로 더 볼 필요 없음
-                        return collected
-                    if count_meaningful_chars_all(text) < 10:
-                        continue
-
-                    weight = get_rating_weight(score)
-                    priority_score = round(weight * (1 + math.log2(1 + 0)), 2)
-                    collected.append(
-                        {
-                            "OS": "iOS",
-                            "출처": "iOS",
-                            "날짜_dt": at,
-                            "날짜": at.strftime("%Y-%m-%d"),
-                            "닉네임": author,
-                            "내용": text,
-                            "심각도 점수": priority_score,
-                            "평점": score,
-                            "좋아요": 0,
-                        }
-                    )
-                    if len(collected) >= desired_count:
-                        return collected[:desired_count]
+            for e in _iter_feed_entries(chunks):
+                row = _build_ios_row(
+                    *_entry_fields(e),
+                    filters,
+                    seen_ids,
+                )
+                if row is _STOP:
+                    return collected
+                if row is None:
+                    continue
+                collected.append(row)
+                if len(collected) >= desired_count:
+                    return collected[:desired_count]
+        finally:
+            chunks.close()
 
     # 2) 보완: 페이지 루프(레거시) 시도
+    # 페이지는 스레드로 미리 받아두고, 처리(중단 조건 포함)는 페이지 순서대로 진행
     for country in countries:
-        for page in range(1, max_pages + 1):
-            url = f"https://itunes.apple.com/{country}/rss/customerreviews/page={page}/id={app_id}/sortby=mostrecent"
-            try:
-                with urllib.request.urlopen(url, timeout=15) as resp:
-                    xml_bytes = resp.read()
-                root = ET.fromstring(xml_bytes)
-            except Exception:
-                continue
-
-            entries = root.findall("atom:entry", ns)
-            if not entries or len(entries) < 2:
-                continue
-
-            for e in entries[1:]:  # 첫 entry는 앱 메타
-                rid = e.findtext("atom:id", default="", namespaces=ns)
-                if not rid or rid in seen_ids:
-                    continue
-                seen_ids.add(rid)
-
-                text = e.findtext("atom:content", default="", namespaces=ns) or ""
-                author = e.findtext("atom:author/atom:name", default="", namespaces=ns) or ""
-                rating_str = e.findtext("im:rating", default="0", namespaces=ns) or "0"
-                try:
-                    score = int(rating_str)
-                except Exception:
-                    score = 0
-                updated_str = e.findtext("atom:updated", default="", namespaces=ns) or ""
-
-                at: Optional[datetime] = None
-                if updated_str:
-                    try:
-                        ts = updated_str.replace("Z", "+0000")
-                        at = datetime.strptime(ts, "%Y-%m-%dT%H:%M:%S%z")
-                    except Exception:
-                        try:
-                            at = datetime.fromisoformat(updated_str.replace("Z", "+00:00"))
-                        except Exception:
-                            at = None
-
-                # 필터 조건
-                if score not in [1, 2, 3, 4, 5]:
-                    continue
-                if rating_exact is not None and score != rating_exact:
-                    continue
-                if rating_exact is None and rating_max is not None and score > max(1, min(5, rating_max)):
-                    continue
-                if not isinstance(at, datetime):
-                    continue
-                if threshold_dt is not None and at < threshold_dt:
-                    return collected
-                if count_meaningful_chars_all(text) < 10:
+        urls = [
+            f"https://itunes.apple.com/{country}/rss/customerreviews/page={page}/id={app_id}/sortby=mostrecent"
+            for page in range(1, max_pages + 1)
+        ]
+        executor = ThreadPoolExecutor(max_workers=_IOS_PAGE_WORKERS)
+        try:
+            for xml_bytes in executor.map(_fetch_feed_page, urls):
+                if xml_bytes is None:
                     continue
 
-                weight = get_rating_weight(score)
-                priority_score = round(weight * (1 + math.log2(1 + 0)), 2)
-
-                collected.append(
-                    {
-                        "OS": "iOS",
-                        "출처": "iOS",
-                        "날짜_dt": at,
-                        "날짜": at.strftime("%Y-%m-%d"),
-                        "닉네임": author,
-                        "내용": text,
-                        "심각도 점수": priority_score,
-                        "평점": score,
-                        "좋아요": 0,
-                    }
-                )
-                if len(collected) >= desired_count:
-                    break
-            if len(collected) >= desired_count:
-                break
-        if len(collected) >= desired_count:
-            break
+                for e in _iter_feed_entries((xml_bytes,)):
+                    row = _build_ios_row(
+                        *_entry_fields(e),
+                        filters,
+                        seen_ids,
+                    )
+                    if row is _STOP:
+                        return collected
+                    if row is None:
+                        continue
+                    collected.append(row)
+                    if len(collected) >= desired_count:
+                        return collected[:desired_count]
+        finally:
+            # 조기 종료 시 아직 시작하지 않은 페이지 요청은 취소
+            executor.shutdown(wait=False, cancel_futures=True)
 
-    return collected[:desired_count]
-    
-    # NOTE: 위에서 return 되지 않았다면 JSON 피드 보완 수집 시도
+    if collected:
+        return collected[:desired_count]
+
+    # 3) XML 경로에서 한 건도 얻지 못한 경우에만 JSON 피드 보완 수집 시도
     # 형식: https://itunes.apple.com/{country}/rss/customerreviews/page={n}/id={app_id}/sortby=mostrecent/json
     # 일부 환경에서 XML이 비어있고 JSON에 값이 존재하는 사례 대응
     for country in countries:
@@ -370,76 +591,78 @@ def fetch_reviews_ios(
                 f"https://itunes.apple.com/{country}/rss/customerreviews/page={page}/id={app_id}/sortby=mostrecent/json"
             )
             try:
-                r = requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
+                r = session.get(url, headers=_APPLE_HEADERS, timeout=10)
                 if r.status_code != 200:
                     continue
-                data = r.json()
+                data = json_loads(r.content)
             except Exception:
                 continue
 
-            entries = _safe_get(data, ["feed", "entry"], [])
+            entries = _get2(data, "feed", "entry", [])
             if not isinstance(entries, list) or len(entries) < 2:
-                continue
+                # 메타 entry만 있거나 비어 있으면 마지막 페이지를 지난 것
+                break
 
             for e in entries[1:]:
-                rid = _safe_get(e, ["id", "label"], "")
-                if not rid or rid in seen_ids:
-                    continue
-                seen_ids.add(rid)
-
-                text = _safe_get(e, ["content", "label"], "") or ""
-                author = _safe_get(e, ["author", "name", "label"], "") or ""
-                rating_str = _safe_get(e, ["im:rating", "label"], "0") or "0"
-                try:
-                    score = int(rating_str)
-                except Exception:
-                    score = 0
-                updated_str = _safe_get(e, ["updated", "label"], "") or ""
-                at = None
-                if updated_str:
-                    try:
-                        ts = updated_str.replace("Z", "+0000")
-                        at = datetime.strptime(ts, "%Y-%m-%dT%H:%M:%S%z")
-                    except Exception:
-                        try:
-                            at = datetime.fromisoformat(updated_str.replace("Z", "+00:00"))
-                        except Exception:
-                            at = None
-
-                if score not in [1, 2, 3, 4, 5]:
-                    continue
-                if rating_exact is not None and score != rating_exact:
-                    continue
-                if rating_exact is None and rating_max is not None and score > max(1, min(5, rating_max)):
-                    continue
-                if not isinstance(at, datetime):
-                    continue
-                if threshold_dt is not None and at < threshold_dt:
+                row = _build_ios_row(
+                    _get2(e, "id", "label") or "",
+                    _get2(e, "content", "label") or "",
+                    _get3(e, "author", "name", "label") or "",
+                    _get2(e, "im:rating", "label", "0") or "0",
+                    _get2(e, "updated", "label") or "",
+                    filters,
+                    seen_ids,
+                )
+                if row is _STOP:
                     return collected
-                if count_meaningful_chars_all(text) < 10:
+                if row is None:
                     continue
-
-                weight = get_rating_weight(score)
-                priority_score = round(weight * (1 + math.log2(1 + 0)), 2)
-                collected.append(
-                    {
-                        "OS": "iOS",
-                        "출처": "iOS",
-                        "날짜_dt": at,
-                        "날짜": at.strftime("%Y-%m-%d"),
-                        "닉네임": author,
-                        "내용": text,
-                        "심각도 점수": priority_score,
-                        "평점": score,
-                        "좋아요": 0,
-                    }
-                )
+                collected.append(row)
                 if len(collected) >= desired_count:
                     return collected[:desired_count]
 
     return collected[:desired_count]
 
 
+def _fetch_app_rows(
+    app: Dict[str, Any],
+    count_per_app: int,
+    threshold_dt: Optional[datetime],
+    rating_exact: Optional[int],
+    rating_max: Optional[int],
+) -> List[Dict[str, Any]]:
+    app_id = app.get("appId") or app.get("id")
+    os_name = app.get("os", "android")
+    service_name = app.get("appName") or app.get("title") or ""
+
+    if os_name == "ios":
+        rows = fetch_reviews_ios(
+            app_id=app_id,
+            desired_count=count_per_app,
+            threshold_dt=threshold_dt,
+            rating_exact=rating_exact,
+            rating_max=rating_max,
+        )
+        os_label = "iOS"
+    else:
+        # android
+        rows = fetch_reviews_iteratively(
+            app_id=app_id,
+            desired_count=count_per_app,
+            threshold_dt=threshold_dt,
+            rating_exact=rating_exact,
+            rating_max=rating_max,
+        )
+        os_label = "Android"
+
+    # 앱별 상한은 여기서 보장(수집 함수도 desired_count에서 멈추지만 방어적으로 절단)
+    rows = rows[:count_per_app]
+    for r in rows:
+        r["서비스명"] = service_name
+        r["OS"] = os_label
+    return rows
+
+
 def build_reviews_multi_payload(
     selected_apps: List[Dict[str, Any]],
     count_per_app: int,
@@ -451,63 +674,28 @@ def build_reviews_multi_payload(
     threshold_dt = compute_threshold_dt(days=days, from_date=from_date)
     combined_rows: List[Dict[str, Any]] = []
 
-    for app in selected_apps[:10]:
-        app_id = app.get("appId") or app.get("id")
-        os_name = app.get("os", "android")
-        service_name = app.get("appName") or app.get("title") or ""
-
-        if os_name == "ios":
-            ios_rows = fetch_reviews_ios(
-                app_id=app_id,
-                desired_count=count_per_app,
-                threshold_dt=threshold_dt,
-                rating_exact=rating_exact,
-                rating_max=rating_max,
-            )
-            for r in ios_rows:
-                r["서비스명"] = service_name
-                r["OS"] = "iOS"
-            combined_rows.extend(ios_rows)
-        else:
-            # android
-            raw = fetch_reviews_iteratively(
-                app_id=app_id,
-                desired_count=count_per_app,
-                threshold_dt=threshold_dt,
-                rating_exact=rating_exact,
-                rating_max=rating_max,
-            )
-            for r in raw:
-                r["서비스명"] = service_name
-                r["OS"] = "Android"
-            combined_rows.extend(raw)
+    # 앱별 수집은 네트워크 대기 위주이므로 스레드로 병렬 처리(결과 순서는 선택 순서 유지)
+    apps = selected_apps[:10]
+    if apps:
+        with ThreadPoolExecutor(max_workers=len(apps)) as executor:
+            futures = [
+                executor.submit(
+                    _fetch_app_rows,
+                    app,
+                    count_per_app,
+                    threshold_dt,
+                    rating_exact,
+                    rating_max,
+                )
+                for app in apps
+            ]
+            for future in futures:
+                combined_rows.extend(future.result())
 
     if combined_rows:
-        df = pd.DataFrame(combined_rows)
-
-        # 안전 제한: 앱(서비스명)별 최대 count_per_app 개수로 제한
-        # 우선 기간(날짜_dt) 기준 최신순 정렬 후 Head 적용 → 평점/기간 필터는 수집 단계에서 이미 적용됨
-        if "서비스명" in df.columns:
-            if "날짜_dt" in df.columns:
-                df = df.sort_values(by=["서비스명", "날짜_dt"], ascending=[True, False])
-            else:
-                df = df.sort_values(by=["서비스명"])  # 날짜 정보가 없으면 그룹 정렬만
-            df = df.groupby("서비스명", group_keys=False).head(count_per_app)
-
-        # 최종 표시 정렬: 심각도 점수 우선, 동점 시 최신순
-        if "날짜_dt" in df.columns:
-            df = df.sort_values(by=["심각도 점수", "날짜_dt"], ascending=[False, False]).reset_index(drop=True)
-        else:
-            df = df.sort_values(by=["심각도 점수"], ascending=[False]).reset_index(drop=True)
-
-        df["순위"] = df["심각도 점수"].rank(method="dense", ascending=False).astype(int)
-        total = len(df)
-        df["백분위"] = df["순위"].apply(lambda r: calc_percentile_display(int(r), total))
-        present_cols = [c for c in [
+        combined_rows = _rank_rows(combined_rows, [
             "OS", "서비스명", "순위", "내용", "심각도 점수", "백분위", "평점", "좋아요", "닉네임", "날짜"
-        ] if c in df.columns]
-        df = df[present_cols]
-        combined_rows = df.to_dict(orient="records")
+        ])
 
     payload: Dict[str, Any] = {
         "meta": {